@@ -1,144 +1,26 @@
-import requests
-from bs4 import BeautifulSoup
 import re
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN
-from pptx.dml.color import RGBColor
+import bisect
 import tkinter as tk
 from tkinter import scrolledtext, messagebox
 import threading
 import os
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 
-def clean_text(text):
-    """Remove ALL special formatting and convert to plain ASCII text."""
-    # Convert to ASCII, ignoring anything that can't be converted
-    return text.encode('ascii', 'ignore').decode('ascii').strip()
+# pptx (via slide_builder), requests, bs4 and lxml (via genius_client) are imported once inside
+# the worker functions that need them, so the Tk window comes up without paying for those imports
 
+# Font size for each slide text length band (text_length < threshold)
+_FONT_SIZE_THRESHOLDS = (80, 120, 180, 250, 350, 450, 600, 800, 1000)
+_FONT_SIZES = (48, 44, 40, 36, 32, 28, 26, 24, 22, 20)
 
-def search_genius_lyrics(song_query):
-    """Search for a song on Genius using the API and get the lyrics URL and content."""
-    
-    # Use the Genius API endpoint
-    url = f"https://genius.com/api/search/multi?per_page=5&q={song_query.replace(' ', '%20')}"
-    
-    print(f"Searching: {url}")
-    
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-    except requests.RequestException as e:
-        print(f"Error fetching search results: {e}")
-        return None
-    
-    # Find the first song result
-    lyrics_url = None
-    song_title = None
-    
-    for section in data['response']['sections']:
-        if section['type'] == 'song':
-            for hit in section['hits']:
-                lyrics_url = hit['result']['url']
-                # Get title and artist and FORCE them to plain text
-                title = clean_text(hit['result']['title'])
-                artist = clean_text(hit['result']['primary_artist']['name'])
-                song_title = f"{title} by {artist}"
-                print(f"Found: {song_title}")
-                print(f"URL: {lyrics_url}")
-                break
-            if lyrics_url:
-                break
-    
-    if not lyrics_url:
-        print("No lyrics URL found in search results")
-        return None
-    
-    # Now fetch the lyrics from the URL
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
-    try:
-        lyrics_response = requests.get(lyrics_url, headers=headers)
-        lyrics_response.raise_for_status()
-    except requests.RequestException as e:
-        print(f"Error fetching lyrics page: {e}")
-        return None
-    
-    lyrics_soup = BeautifulSoup(lyrics_response.text, 'html.parser')
-    
-    # Find lyrics containers
-    lyrics_containers = lyrics_soup.find_all('div', attrs={'data-lyrics-container': 'true'})
-    
-    if not lyrics_containers:
-        lyrics_containers = lyrics_soup.find_all('div', class_=re.compile(r'Lyrics__Container'))
-    
-    if not lyrics_containers:
-        print("Could not find lyrics in the page")
-        return {'url': lyrics_url, 'title': song_title, 'lyrics': None}
-    
-    lyrics_text = []
-    for container in lyrics_containers:
-        for br in container.find_all('br'):
-            br.replace_with('\n')
-        text = container.get_text()
-        lyrics_text.append(text)
-    
-    lyrics = '\n\n'.join(lyrics_text).strip()
-    
-    return {
-        'url': lyrics_url,
-        'title': song_title,
-        'lyrics': lyrics
-    }
-
-
-def parse_lyrics_sections(lyrics_text):
-    """
-    Parse lyrics into sections based on brackets [Section Name].
-    Returns list of tuples: (section_name, section_text)
-    Only includes sections that have bracket markers.
-    """
-    sections = []
-    
-    # Split by sections marked with [...]
-    parts = re.split(r'\[([^\]]+)\]', lyrics_text)
-    
-    # Skip the first part if there's content before any section markers
-    for i in range(1, len(parts), 2):
-        if i < len(parts):
-            section_name = parts[i].strip()
-            section_text = parts[i + 1].strip() if i + 1 < len(parts) else ""
-            
-            if section_text:  # Only add if there's actual content
-                sections.append((section_name, section_text))
-    
-    return sections
+_SAFE_CHARS_RE = re.compile(r'[^\w -]+')
 
 
 def calculate_font_size(text_length):
     """Calculate appropriate font size based on text length with more granular hierarchy."""
-    if text_length < 80:
-        return 48
-    elif text_length < 120:
-        return 44
-    elif text_length < 180:
-        return 40
-    elif text_length < 250:
-        return 36
-    elif text_length < 350:
-        return 32
-    elif text_length < 450:
-        return 28
-    elif text_length < 600:
-        return 26
-    elif text_length < 800:
-        return 24
-    elif text_length < 1000:
-        return 22
-    else:
-        return 20
+    # First threshold the length falls below picks the size; past the last one -> smallest
+    return _FONT_SIZES[bisect.bisect_right(_FONT_SIZE_THRESHOLDS, text_length)]
 
 
 def create_lyrics_presentation(song_title, sections, output_file="lyrics_presentation.pptx"):
@@ -151,67 +33,28 @@ def create_lyrics_presentation(song_title, sections, output_file="lyrics_present
         output_file (str): Output filename
     """
     
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
+    from slide_builder import Inches, SLIDE_BG, new_presentation, add_blank_slide, add_text_box, add_title_slide
     
-    # Slide 1: Title slide
-    blank_layout = prs.slide_layouts[6]  # Blank layout
-    slide = prs.slides.add_slide(blank_layout)
-    
-    # Add title text box
-    left = Inches(0.5)
-    top = Inches(2.5)
-    width = Inches(9)
-    height = Inches(2)
+    # Section slide layout, built once per presentation instead of on every slide
+    lyrics_top, lyrics_height = Inches(1), Inches(6)
     
-    txBox = slide.shapes.add_textbox(left, top, width, height)
-    tf = txBox.text_frame
-    tf.word_wrap = True  # Enable word wrap
-    tf.text = song_title
-    tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-    tf.paragraphs[0].font.size = Pt(54)
-    tf.paragraphs[0].font.bold = True
-    tf.paragraphs[0].font.color.rgb = RGBColor(0, 0, 0)
+    prs, blank_layout = new_presentation()
     
-    # Set background color
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(240, 240, 255)
+    # Slide 1: Title slide
+    add_title_slide(prs, blank_layout, song_title)
     
     print(f"Created title slide: {song_title}")
     
     # Create slides for each section (without the [Section Name] header)
     for section_name, section_text in sections:
-        slide = prs.slides.add_slide(blank_layout)
+        slide = add_blank_slide(prs, blank_layout, SLIDE_BG)
         
         # Calculate font size based on content length
         content_length = len(section_text)
         font_size = calculate_font_size(content_length)
         
         # Add lyrics text (centered, taking full vertical space)
-        left = Inches(0.5)
-        top = Inches(1)
-        width = Inches(9)
-        height = Inches(6)
-        
-        text_box = slide.shapes.add_textbox(left, top, width, height)
-        tf = text_box.text_frame
-        tf.word_wrap = True
-        tf.text = section_text
-        
-        # Center align and format
-        for paragraph in tf.paragraphs:
-            paragraph.alignment = PP_ALIGN.CENTER
-            paragraph.font.size = Pt(font_size)
-            paragraph.font.color.rgb = RGBColor(0, 0, 0)
-        
-        # Set background color
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = RGBColor(255, 255, 255)
+        add_text_box(slide, section_text, lyrics_top, lyrics_height, font_size)
         
         print(f"Created slide: [{section_name}] ({content_length} chars, {font_size}pt font)")
     
@@ -221,38 +64,38 @@ def create_lyrics_presentation(song_title, sections, output_file="lyrics_present
     print(f"  Total slides: {len(prs.slides)}")
 
 
-def process_single_song(song_query, output_folder, log_callback):
-    """Process a single song and create presentation."""
+def fetch_song(song_query, log_callback):
+    """Fetch and parse the lyrics for a single song. Returns (title, sections) or None."""
+    from genius_client import search_genius_lyrics, parse_lyrics_sections
+    
+    # Songs are fetched concurrently, so collect this song's lines and log them as one block
+    lines = [f"\n{'='*60}", f"Processing: {song_query}"]
     try:
-        log_callback(f"\n{'='*60}")
-        log_callback(f"Processing: {song_query}")
-        
         # Search and get lyrics
         result = search_genius_lyrics(song_query)
         
         if not result or not result['lyrics']:
-            log_callback(f"❌ Could not retrieve lyrics for: {song_query}")
-            return False
+            lines.append(f"❌ Could not retrieve lyrics for: {song_query}")
+            return None
         
-        log_callback(f"✓ Found: {result['title']}")
+        lines.append(f"✓ Found: {result['title']}")
         
         # Parse lyrics into sections
         sections = parse_lyrics_sections(result['lyrics'])
-        log_callback(f"✓ Parsed {len(sections)} sections")
-        
-        # Create safe filename
-        safe_filename = "".join(c for c in song_query if c.isalnum() or c in (' ', '-', '_')).strip()
-        safe_filename = safe_filename.replace(' ', '_')
-        output_file = os.path.join(output_folder, f"{safe_filename}.pptx")
-        
-        # Create PowerPoint
-        create_lyrics_presentation(result['title'], sections, output_file)
-        log_callback(f"✓ Saved: {output_file}")
+        lines.append(f"✓ Parsed {len(sections)} sections")
         
-        return True
+        return result['title'], sections
     except Exception as e:
-        log_callback(f"❌ Error processing '{song_query}': {str(e)}")
-        return False
+        lines.append(f"❌ Error processing '{song_query}': {str(e)}")
+        return None
+    finally:
+        log_callback("\n".join(lines))
+
+
+def write_pptx(song_title, sections, output_file):
+    """Create the presentation file. Runs in a worker process, so it must stay picklable."""
+    create_lyrics_presentation(song_title, sections, output_file)
+    return output_file
 
 
 class LyricsGUI:
@@ -303,12 +146,19 @@ class LyricsGUI:
                                                   bg="#f0f0f0")
         self.log_area.pack(pady=5, padx=20)
         
+        self._log_lock = threading.Lock()
+        
     def log(self, message):
         """Add message to log area."""
         self.log_area.insert(tk.END, message + "\n")
         self.log_area.see(tk.END)
         self.root.update_idletasks()
     
+    def _threadsafe_log(self, message):
+        """Schedule a log message on the Tk main loop (Tk is not thread-safe)."""
+        with self._log_lock:
+            self.root.after(0, self.log, message)
+    
     def start_processing(self):
         """Start processing songs in a separate thread."""
         # Get input
@@ -338,24 +188,59 @@ class LyricsGUI:
             # Create output folder
             if not os.path.exists(output_folder):
                 os.makedirs(output_folder)
-                self.log(f"✓ Created output folder: {output_folder}")
+                self._threadsafe_log(f"✓ Created output folder: {output_folder}")
             
-            self.log(f"\nProcessing {len(songs)} song(s)...\n")
+            self._threadsafe_log(f"\nProcessing {len(songs)} song(s)...\n")
             
             success_count = 0
             fail_count = 0
             
-            for song in songs:
-                if process_single_song(song, output_folder, self.log):
-                    success_count += 1
-                else:
-                    fail_count += 1
+            # Lyrics fetches are network-bound, so they run in threads sharing the session pool.
+            # Building a .pptx is CPU-bound Python, so each one goes to a worker process as soon
+            # as its lyrics arrive. Use spawn: forking a process running Tk and threads is unsafe.
+            with ThreadPoolExecutor(max_workers=min(8, len(songs))) as fetch_executor, \
+                    ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(songs)),
+                                        mp_context=multiprocessing.get_context('spawn')) as write_executor:
+                fetches = {
+                    fetch_executor.submit(fetch_song, song, self._threadsafe_log): song
+                    for song in songs
+                }
+                writes = {}
+                used_paths = set()
+                for future in as_completed(fetches):
+                    song = fetches[future]
+                    fetched = future.result()
+                    if fetched is None:
+                        fail_count += 1
+                        continue
+                    
+                    # Create safe filename
+                    song_title, sections = fetched
+                    safe_filename = _SAFE_CHARS_RE.sub('', song).strip().replace(' ', '_')
+                    output_file = os.path.join(output_folder, f"{safe_filename}.pptx")
+                    # Queries that sanitize to the same name would overwrite each other concurrently
+                    suffix = 2
+                    while output_file in used_paths:
+                        output_file = os.path.join(output_folder, f"{safe_filename}_{suffix}.pptx")
+                        suffix += 1
+                    used_paths.add(output_file)
+                    writes[write_executor.submit(write_pptx, song_title, sections, output_file)] = song
+                
+                for future in as_completed(writes):
+                    try:
+                        output_file = future.result()
+                    except Exception as e:
+                        self._threadsafe_log(f"❌ Error processing '{writes[future]}': {str(e)}")
+                        fail_count += 1
+                    else:
+                        self._threadsafe_log(f"✓ Saved: {output_file}")
+                        success_count += 1
             
-            self.log(f"\n{'='*60}")
-            self.log(f"COMPLETED!")
-            self.log(f"✓ Success: {success_count}")
-            self.log(f"❌ Failed: {fail_count}")
-            self.log(f"Output folder: {os.path.abspath(output_folder)}")
+            self._threadsafe_log(f"\n{'='*60}")
+            self._threadsafe_log(f"COMPLETED!")
+            self._threadsafe_log(f"✓ Success: {success_count}")
+            self._threadsafe_log(f"❌ Failed: {fail_count}")
+            self._threadsafe_log(f"Output folder: {os.path.abspath(output_folder)}")
             
             messagebox.showinfo("Complete", 
                               f"Processing complete!\n\n"
@@ -364,7 +249,7 @@ class LyricsGUI:
                               f"Files saved in: {output_folder}")
             
         except Exception as e:
-            self.log(f"\n❌ ERROR: {str(e)}")
+            self._threadsafe_log(f"\n❌ ERROR: {str(e)}")
             messagebox.showerror("Error", f"An error occurred:\n{str(e)}")
         
         finally:
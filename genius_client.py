@@ -0,0 +1,238 @@
+"""Genius search and lyrics scraping shared by the GUI and the standalone scripts."""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    from requests_cache import CachedSession, DO_NOT_CACHE
+except ImportError:
+    CachedSession = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from bs4 import BeautifulSoup
+import re
+import functools
+from html import unescape
+from urllib.parse import quote_plus
+
+# Shared session so repeated requests to genius.com reuse pooled keep-alive connections.
+# With requests-cache installed, search API responses are also kept on disk (delete
+# .genius_cache.sqlite to reset). Lyrics pages are not: caching would read the whole page
+# before the size cap applies, and the extracted lyrics are memoized in process anyway
+if CachedSession is not None:
+    SESSION = CachedSession(
+        '.genius_cache',
+        allowable_methods=['GET'],
+        urls_expire_after={'genius.com/api/*': 7 * 24 * 3600, '*': DO_NOT_CACHE},
+    )
+else:
+    SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+# Prefer lxml for page parsing; fall back to BeautifulSoup's pure-Python parser if it isn't installed
+try:
+    import lxml.html as LH
+except ImportError:
+    LH = None
+
+# (connect, read) timeouts so a slow host can't stall a worker indefinitely
+_TIMEOUT = (3.05, 10)
+# Lyrics pages carry large inline scripts; the lyrics sit well inside this many bytes
+_MAX_PAGE_BYTES = 2_000_000
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_BR_RE = re.compile(r'<br\s*/?>', re.I)
+_TAG_RE = re.compile(r'<[^>]+>')
+_SECTION_RE = re.compile(r'\[([^\]]+)\]')
+_LYRICS_CLASS_RE = re.compile(r'Lyrics__Container')
+
+
+def clean_text(text):
+    """Remove ALL special formatting and convert to plain ASCII text."""
+    # Convert to ASCII, ignoring anything that can't be converted
+    return text.encode('ascii', 'ignore').decode('ascii').strip()
+
+
+def extract_lyrics_text(page_content, encoding=None):
+    """
+    Return the text of every lyrics container in a Genius lyrics page.
+    
+    `encoding` is the charset from the HTTP Content-Type header, if it named one;
+    without it the parser falls back to the page's <meta charset>.
+    """
+    # lxml refuses an empty document; treat it like a page without lyrics
+    if not page_content.strip():
+        return []
+    
+    if LH is not None:
+        # Query the containers directly with XPath instead of walking a BeautifulSoup tree
+        parser = LH.HTMLParser(encoding=encoding) if encoding else None
+        doc = LH.fromstring(page_content, parser=parser)
+        containers = doc.xpath('//div[@data-lyrics-container="true"]')
+        if not containers:
+            containers = doc.xpath('//div[contains(@class, "Lyrics__Container")]')
+        
+        lyrics_text = []
+        for node in containers:
+            # Turn every <br> into a newline in one pass over the serialized container
+            html_str = _BR_RE.sub('\n', LH.tostring(node, encoding='unicode', with_tail=False))
+            lyrics_text.append(LH.fromstring(html_str).text_content())
+        return lyrics_text
+    
+    lyrics_soup = BeautifulSoup(page_content, 'html.parser', from_encoding=encoding)
+    
+    # Find lyrics containers
+    lyrics_containers = lyrics_soup.find_all('div', attrs={'data-lyrics-container': 'true'})
+    
+    if not lyrics_containers:
+        lyrics_containers = lyrics_soup.find_all('div', class_=_LYRICS_CLASS_RE)
+    
+    lyrics_text = []
+    for container in lyrics_containers:
+        # Swap <br> tags for newlines and strip the remaining markup in two regex passes
+        html_str = _BR_RE.sub('\n', container.decode_contents())
+        lyrics_text.append(unescape(_TAG_RE.sub('', html_str)))
+    
+    return lyrics_text
+
+
+def _read_capped(response, limit=_MAX_PAGE_BYTES):
+    """Read a streamed response body, stopping once `limit` decoded bytes have arrived."""
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return b''.join(chunks)[:limit]
+
+
+def _decode_json(response):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is None:
+        return response.json()
+    
+    # Parse the raw bytes directly, skipping the str decode response.json() does first
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.JSONDecodeError(e.msg, e.doc, e.pos, response=response)
+
+
+def search_genius_lyrics(song_query):
+    """
+    Search for a song on Genius using the API and get the lyrics URL and content.
+    
+    Args:
+        song_query (str): Song name to search (e.g., "king of my heart bethel")
+    
+    Returns:
+        dict: Contains 'url', 'title', and 'lyrics' if found
+    """
+    
+    # Normalize and URL-encode once; "Oceans  Hillsong" and "oceans hillsong" share one cache entry
+    encoded_query = quote_plus(_WHITESPACE_RE.sub(' ', song_query).strip().lower())
+    
+    try:
+        return _search_genius_lyrics_cached(encoded_query)
+    except requests.RequestException:
+        # Already reported; not cached, so the next attempt goes back to the network
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _search_genius_lyrics_cached(encoded_query):
+    """Memoized lookup behind search_genius_lyrics; network errors propagate and are not cached."""
+    
+    # Use the Genius API endpoint
+    url = f"https://genius.com/api/search/multi?per_page=5&q={encoded_query}"
+    
+    print(f"Searching: {url}")
+    
+    try:
+        response = SESSION.get(url, timeout=_TIMEOUT)
+        response.raise_for_status()
+        data = _decode_json(response)
+    except requests.RequestException as e:
+        print(f"Error fetching search results: {e}")
+        raise
+    
+    # Find the first song result
+    lyrics_url = None
+    song_title = None
+    
+    for section in data['response']['sections']:
+        if section['type'] == 'song':
+            for hit in section['hits']:
+                lyrics_url = hit['result']['url']
+                # Get title and artist and FORCE them to plain text
+                title = clean_text(hit['result']['title'])
+                artist = clean_text(hit['result']['primary_artist']['name'])
+                song_title = f"{title} by {artist}"
+                print(f"Found: {song_title}")
+                print(f"URL: {lyrics_url}")
+                break
+            if lyrics_url:
+                break
+    
+    if not lyrics_url:
+        print("No lyrics URL found in search results")
+        return None
+    
+    # Now fetch the lyrics from the URL
+    try:
+        # The with block releases the pooled connection even when raise_for_status() fails
+        with SESSION.get(lyrics_url, stream=True, timeout=_TIMEOUT) as lyrics_response:
+            lyrics_response.raise_for_status()
+            page_content = _read_capped(lyrics_response)
+            # requests guesses ISO-8859-1 for text/* without a charset, so only pass a declared one
+            content_type = lyrics_response.headers.get('Content-Type', '').lower()
+            encoding = lyrics_response.encoding if 'charset=' in content_type else None
+    except requests.RequestException as e:
+        print(f"Error fetching lyrics page: {e}")
+        raise
+    
+    lyrics_text = extract_lyrics_text(page_content, encoding)
+    
+    if not lyrics_text:
+        print("Could not find lyrics in the page")
+        return {'url': lyrics_url, 'title': song_title, 'lyrics': None}
+    
+    lyrics = '\n\n'.join(lyrics_text).strip()
+    
+    return {
+        'url': lyrics_url,
+        'title': song_title,
+        'lyrics': lyrics
+    }
+
+
+def parse_lyrics_sections(lyrics_text):
+    """
+    Parse lyrics into sections based on brackets [Section Name].
+    Returns list of tuples: (section_name, section_text)
+    Only includes sections that have bracket markers.
+    """
+    sections = []
+    
+    # Walk the [...] markers once, slicing each body straight out of the original text
+    # (content before the first marker is skipped)
+    matches = list(_SECTION_RE.finditer(lyrics_text))
+    for i, match in enumerate(matches):
+        section_name = match.group(1).strip()
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(lyrics_text)
+        section_text = lyrics_text[match.end():end].strip()
+        
+        if section_text:  # Only add if there's actual content
+            sections.append((section_name, section_text))
+    
+    return sections
@@ -1,123 +1,23 @@
-import requests
-from bs4 import BeautifulSoup
-import re
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN
-from pptx.dml.color import RGBColor
-
-def search_genius_lyrics(song_query):
-    """Search for a song on Genius using the API and get the lyrics URL and content."""
-    
-    # Use the Genius API endpoint
-    url = f"https://genius.com/api/search/multi?per_page=5&q={song_query.replace(' ', '%20')}"
-    
-    print(f"Searching: {url}")
-    
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-    except requests.RequestException as e:
-        print(f"Error fetching search results: {e}")
-        return None
-    
-    # Find the first song result
-    lyrics_url = None
-    song_title = None
-    
-    for section in data['response']['sections']:
-        if section['type'] == 'song':
-            for hit in section['hits']:
-                lyrics_url = hit['result']['url']
-                song_title = hit['result']['title']  # Changed from 'full_title' to 'title'
-                print(f"Found: {song_title}")
-                print(f"URL: {lyrics_url}")
-                break
-            if lyrics_url:
-                break
-    
-    if not lyrics_url:
-        print("No lyrics URL found in search results")
-        return None
-    
-    # Now fetch the lyrics from the URL
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
-    try:
-        lyrics_response = requests.get(lyrics_url, headers=headers)
-        lyrics_response.raise_for_status()
-    except requests.RequestException as e:
-        print(f"Error fetching lyrics page: {e}")
-        return None
-    
-    lyrics_soup = BeautifulSoup(lyrics_response.text, 'html.parser')
-    
-    # Find lyrics containers
-    lyrics_containers = lyrics_soup.find_all('div', attrs={'data-lyrics-container': 'true'})
-    
-    if not lyrics_containers:
-        lyrics_containers = lyrics_soup.find_all('div', class_=re.compile(r'Lyrics__Container'))
-    
-    if not lyrics_containers:
-        print("Could not find lyrics in the page")
-        return {'url': lyrics_url, 'title': song_title, 'lyrics': None}
-    
-    lyrics_text = []
-    for container in lyrics_containers:
-        for br in container.find_all('br'):
-            br.replace_with('\n')
-        text = container.get_text()
-        lyrics_text.append(text)
-    
-    lyrics = '\n\n'.join(lyrics_text).strip()
-    
-    return {
-        'url': lyrics_url,
-        'title': song_title,
-        'lyrics': lyrics
-    }
+import bisect
+from pptx.util import Inches
+from genius_client import search_genius_lyrics, parse_lyrics_sections
+from slide_builder import SLIDE_BG, new_presentation, add_blank_slide, add_text_box, add_title_slide
 
+# Font size for each slide text length band (text_length < threshold)
+_FONT_SIZE_THRESHOLDS = (100, 200, 300, 500, 700)
+_FONT_SIZES = (44, 36, 32, 28, 24, 20)
 
-def parse_lyrics_sections(lyrics_text):
-    """
-    Parse lyrics into sections based on brackets [Section Name].
-    Returns list of tuples: (section_name, section_text)
-    Only includes sections that have bracket markers.
-    """
-    sections = []
-    
-    # Split by sections marked with [...]
-    parts = re.split(r'\[([^\]]+)\]', lyrics_text)
-    
-    # Skip the first part if there's content before any section markers
-    for i in range(1, len(parts), 2):
-        if i < len(parts):
-            section_name = parts[i].strip()
-            section_text = parts[i + 1].strip() if i + 1 < len(parts) else ""
-            
-            if section_text:  # Only add if there's actual content
-                sections.append((section_name, section_text))
-    
-    return sections
+# Section slide layout, built once instead of on every slide
+_HEADER_TOP = Inches(0.3)
+_HEADER_H = Inches(0.8)
+_TOP = Inches(1.5)
+_H = Inches(5.5)
 
 
 def calculate_font_size(text_length):
     """Calculate appropriate font size based on text length."""
-    if text_length < 100:
-        return 44
-    elif text_length < 200:
-        return 36
-    elif text_length < 300:
-        return 32
-    elif text_length < 500:
-        return 28
-    elif text_length < 700:
-        return 24
-    else:
-        return 20
+    # First threshold the length falls below picks the size; past the last one -> smallest
+    return _FONT_SIZES[bisect.bisect_right(_FONT_SIZE_THRESHOLDS, text_length)]
 
 
 def create_lyrics_presentation(song_title, sections, output_file="lyrics_presentation.pptx"):
@@ -130,80 +30,27 @@ def create_lyrics_presentation(song_title, sections, output_file="lyrics_present
         output_file (str): Output filename
     """
     
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
+    prs, blank_layout = new_presentation()
     
     # Slide 1: Title slide
-    blank_layout = prs.slide_layouts[6]  # Blank layout
-    slide = prs.slides.add_slide(blank_layout)
-    
-    # Add title text box
-    left = Inches(0.5)
-    top = Inches(2.5)
-    width = Inches(9)
-    height = Inches(2)
-    
-    txBox = slide.shapes.add_textbox(left, top, width, height)
-    tf = txBox.text_frame
-    tf.text = song_title
-    tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-    tf.paragraphs[0].font.size = Pt(54)
-    tf.paragraphs[0].font.bold = True
-    tf.paragraphs[0].font.color.rgb = RGBColor(0, 0, 0)
-    
-    # Set background color
-    background = slide.background
-    fill = background.fill
-    fill.solid()
-    fill.fore_color.rgb = RGBColor(240, 240, 255)
+    add_title_slide(prs, blank_layout, song_title, wrap='none')
     
     print(f"Created title slide: {song_title}")
     
     # Create slides for each section
     for section_name, section_text in sections:
-        slide = prs.slides.add_slide(blank_layout)
+        slide = add_blank_slide(prs, blank_layout, SLIDE_BG)
         
         # Calculate font size based on content length
         content_length = len(section_text)
         font_size = calculate_font_size(content_length)
         
         # Add section name (at top)
-        left = Inches(0.5)
-        top = Inches(0.3)
-        width = Inches(9)
-        height = Inches(0.8)
-        
-        section_box = slide.shapes.add_textbox(left, top, width, height)
-        section_tf = section_box.text_frame
-        section_tf.text = f"[{section_name}]"
-        section_tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-        section_tf.paragraphs[0].font.size = Pt(24)
-        section_tf.paragraphs[0].font.bold = True
-        section_tf.paragraphs[0].font.color.rgb = RGBColor(100, 100, 150)
+        add_text_box(slide, f"[{section_name}]", _HEADER_TOP, _HEADER_H, 24, bold=True, color='646496',
+                     wrap='none')
         
         # Add lyrics text (centered)
-        left = Inches(0.5)
-        top = Inches(1.5)
-        width = Inches(9)
-        height = Inches(5.5)
-        
-        text_box = slide.shapes.add_textbox(left, top, width, height)
-        tf = text_box.text_frame
-        tf.word_wrap = True
-        tf.text = section_text
-        
-        # Center align and format
-        for paragraph in tf.paragraphs:
-            paragraph.alignment = PP_ALIGN.CENTER
-            paragraph.font.size = Pt(font_size)
-            paragraph.font.color.rgb = RGBColor(0, 0, 0)
-        
-        # Set background color
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = RGBColor(255, 255, 255)
+        add_text_box(slide, section_text, _TOP, _H, font_size)
         
         print(f"Created slide: [{section_name}] ({content_length} chars, {font_size}pt font)")
     
@@ -0,0 +1,87 @@
+"""DrawingML slide helpers shared by the lyrics presentation builders."""
+import re
+from pptx import Presentation
+from pptx.util import Inches
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from xml.sax.saxutils import escape
+
+# Slide geometry and colors, built once instead of on every slide
+_SLIDE_W = Inches(10)
+_SLIDE_H = Inches(7.5)
+_LEFT = Inches(0.5)
+_W = Inches(9)
+_TITLE_TOP = Inches(2.5)
+_TITLE_H = Inches(2)
+TITLE_BG = 'F0F0FF'
+SLIDE_BG = 'FFFFFF'
+
+# DrawingML templates for the slide background and centered text boxes, filled in with
+# str.format so each slide is built from a few parse_xml calls instead of python-pptx setters
+_BACKGROUND_XML = (
+    '<p:bg %s><p:bgPr><a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+    '<a:effectLst/></p:bgPr></p:bg>' % nsdecls('a', 'p')
+)
+_TEXTBOX_XML = (
+    '<p:sp %s>'
+    '<p:nvSpPr><p:cNvPr id="{id}" name="TextBox {name}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="{wrap}"><a:spAutoFit/></a:bodyPr><a:lstStyle/>{paragraphs}</p:txBody>'
+    '</p:sp>' % nsdecls('a', 'p')
+)
+_RUN_PROPS_XML = (
+    '<a:rPr lang="en-US" sz="{size}" b="{bold}">'
+    '<a:solidFill><a:srgbClr val="{color}"/></a:solidFill></a:rPr>'
+)
+_RUN_XML = '<a:r>{props}<a:t>{text}</a:t></a:r>'
+_BREAK_XML = '<a:br>{props}</a:br>'
+_PARAGRAPH_XML = '<a:p><a:pPr algn="ctr"/>{runs}</a:p>'
+
+# C0 control characters are not allowed in XML; escape them as _xHHHH_ like python-pptx does
+_CTRL_CHARS_RE = re.compile(r'[\x00-\x08\x0b-\x1f]')
+
+
+def _escape_ctrl_char(match):
+    return '_x%04X_' % ord(match.group())
+
+
+def _paragraph_xml(line, props):
+    """Render one line as a centered paragraph; vertical tabs become line breaks, as in python-pptx."""
+    runs = [
+        _RUN_XML.format(props=props, text=escape(_CTRL_CHARS_RE.sub(_escape_ctrl_char, part)))
+        for part in line.split('\v')
+    ]
+    return _PARAGRAPH_XML.format(runs=_BREAK_XML.format(props=props).join(runs))
+
+
+def new_presentation():
+    """Create an empty 10x7.5in presentation. Returns (presentation, blank slide layout)."""
+    prs = Presentation()
+    prs.slide_width = _SLIDE_W
+    prs.slide_height = _SLIDE_H
+    return prs, prs.slide_layouts[6]
+
+
+def add_blank_slide(prs, layout, bg_color):
+    """Add a slide with a solid background color (hex string, e.g. 'FFFFFF')."""
+    slide = prs.slides.add_slide(layout)
+    slide._element.cSld.insert(0, parse_xml(_BACKGROUND_XML.format(color=bg_color)))
+    return slide
+
+
+def add_text_box(slide, text, top, height, font_size, bold=False, color='000000', wrap='square'):
+    """Add a full-width text box with one centered paragraph per line of text; wrap is 'square' or 'none'."""
+    props = _RUN_PROPS_XML.format(size=font_size * 100, bold=int(bold), color=color)
+    paragraphs = ''.join(_paragraph_xml(line, props) for line in text.split('\n'))
+    shape_id = slide.shapes._next_shape_id
+    sp = parse_xml(_TEXTBOX_XML.format(id=shape_id, name=shape_id - 1, x=_LEFT, y=top, cx=_W, cy=height,
+                                       wrap=wrap, paragraphs=paragraphs))
+    slide.shapes._spTree.insert_element_before(sp, 'p:extLst')
+
+
+def add_title_slide(prs, layout, song_title, wrap='square'):
+    """Add the title slide: the song title, large and bold, on a pale blue background."""
+    slide = add_blank_slide(prs, layout, TITLE_BG)
+    add_text_box(slide, song_title, _TITLE_TOP, _TITLE_H, 54, bold=True, wrap=wrap)
+    return slide
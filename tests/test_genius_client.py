@@ -0,0 +1,29 @@
+import pytest
+
+import genius_client
+from genius_client import extract_lyrics_text
+
+
+@pytest.mark.parametrize("page_content", [b"", b"   \n"])
+def test_extract_lyrics_text_empty_page(page_content):
+    assert extract_lyrics_text(page_content) == []
+
+
+def test_extract_lyrics_text_empty_page_without_lxml(monkeypatch):
+    monkeypatch.setattr(genius_client, "LH", None)
+    assert extract_lyrics_text(b"") == []
+
+
+LYRICS = "Café’s “song”"
+PAGE_WITHOUT_META = (
+    '<html><body><div data-lyrics-container="true">%s<br>line two</div></body></html>' % LYRICS
+).encode("utf-8")
+
+
+def test_extract_lyrics_text_uses_header_encoding():
+    assert extract_lyrics_text(PAGE_WITHOUT_META, "utf-8") == [LYRICS + "\nline two"]
+
+
+def test_extract_lyrics_text_uses_header_encoding_without_lxml(monkeypatch):
+    monkeypatch.setattr(genius_client, "LH", None)
+    assert extract_lyrics_text(PAGE_WITHOUT_META, "utf-8") == [LYRICS + "\nline two"]
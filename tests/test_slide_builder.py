@@ -0,0 +1,33 @@
+from pptx import Presentation
+
+import scrappingPpptx
+from slide_builder import SLIDE_BG, new_presentation, add_blank_slide, add_text_box
+
+
+def _pptx_text(text):
+    """Text as python-pptx itself stores and reads it back through a text frame."""
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    text_frame = slide.shapes.add_textbox(0, 0, 100, 100).text_frame
+    text_frame.text = text
+    return text_frame.text
+
+
+def test_add_text_box_handles_control_characters():
+    prs, blank_layout = new_presentation()
+    slide = add_blank_slide(prs, blank_layout, SLIDE_BG)
+    text = "line\x0bbreak\nbell\x07 & <tag>\x1f"
+
+    add_text_box(slide, text, 0, 100, 24)
+
+    assert slide.shapes[0].text_frame.text == _pptx_text(text)
+
+
+def test_create_lyrics_presentation_with_control_characters(tmp_path):
+    output_file = str(tmp_path / "ctl.pptx")
+
+    scrappingPpptx.create_lyrics_presentation("ctl\x0bchar", [("V", "bell\x07")], output_file)
+
+    title_slide, section_slide = Presentation(output_file).slides
+    assert title_slide.shapes[0].text_frame.text == _pptx_text("ctl\x0bchar")
+    assert section_slide.shapes[1].text_frame.text == _pptx_text("bell\x07")